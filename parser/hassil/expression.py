@@ -1,9 +1,11 @@
 """Classes for representing sentence templates."""
 import re
+import sys
+import weakref
 from abc import ABC
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import List, Optional
+from typing import Any, ClassVar, List, Optional, Type, TypeVar
 
 # 0..100, -100..100
 NUMBER_RANGE_PATTERN = re.compile(r"^(-?[0-9]+)\.\.(-?[0-9]+),?(?P<step>[0-9]+)?$")
@@ -23,11 +25,37 @@ def remove_quotes(text: str) -> str:
     return text
 
 
+_DataclassT = TypeVar("_DataclassT")
+
+
+def _with_slots(cls: Type[_DataclassT]) -> Type[_DataclassT]:
+    """Recreate a dataclass with __slots__ (dataclass(slots=True) before Python 3.10)."""
+    dataclass_cls: Any = cls
+    inherited = {
+        name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())
+    }
+    slot_names = tuple(f.name for f in fields(dataclass_cls) if f.name not in inherited)
+
+    # Field defaults are class attributes, which conflict with slots
+    cls_dict = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in slot_names + ("__dict__", "__weakref__")
+    }
+    cls_dict["__slots__"] = slot_names
+
+    return type(dataclass_cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
 @dataclass
 class Expression(ABC):
     """Base class for expressions."""
 
+    # Allows weak references from shared pools
+    __slots__ = ("__weakref__",)
+
 
+@_with_slots
 @dataclass
 class Word(Expression):
     """Single word/token."""
@@ -35,6 +63,11 @@ class Word(Expression):
     # Text representation expression
     text: str = ""
 
+    # Shared instances by text (dropped when no longer in use)
+    _pool: ClassVar[
+        "weakref.WeakValueDictionary[str, Word]"
+    ] = weakref.WeakValueDictionary()
+
     @property
     def is_empty(self) -> bool:
         """True if the word is empty"""
@@ -42,8 +75,18 @@ class Word(Expression):
 
     @staticmethod
     def empty() -> "Word":
-        """Returns an empty word"""
-        return Word()
+        """Returns the shared empty word"""
+        return Word.get("")
+
+    @classmethod
+    def get(cls, text: str) -> "Word":
+        """Returns a shared word for text. Shared words must not be modified."""
+        word = cls._pool.get(text)
+        if word is None:
+            word = cls(sys.intern(text))
+            cls._pool[text] = word
+
+        return word
 
 
 class SequenceType(str, Enum):
@@ -56,6 +99,7 @@ class SequenceType(str, Enum):
     ALTERNATIVE = "alternative"
 
 
+@_with_slots
 @dataclass
 class Sequence(Expression):
     """Ordered sequence of expressions. Supports groups, optionals, and alternatives."""
@@ -67,6 +111,7 @@ class Sequence(Expression):
     type: SequenceType = SequenceType.GROUP
 
 
+@_with_slots
 @dataclass
 class RuleReference(Expression):
     """Reference to an expansion rule by <name>."""
@@ -75,6 +120,7 @@ class RuleReference(Expression):
     rule_name: str = ""
 
 
+@_with_slots
 @dataclass
 class ListReference(Expression):
     """Reference to a list by {name}."""
@@ -96,6 +142,7 @@ class ListReference(Expression):
         return self._slot_name
 
 
+@_with_slots
 @dataclass
 class Number(Expression):
     """Single number."""
@@ -103,6 +150,7 @@ class Number(Expression):
     number: Optional[int] = None
 
 
+@_with_slots
 @dataclass
 class NumberRange(Expression):
     """Number range of the form N..M where N<M."""
@@ -124,6 +172,7 @@ class NumberRange(Expression):
         return item in range(self.lower_bound, self.upper_bound + 1, self.step)
 
 
+@_with_slots
 @dataclass
 class Sentence(Sequence):
     """Sequence representing a complete sentence template."""
@@ -1,7 +1,15 @@
 """Listener for converting ANTLR parse into Sentence expressions."""
-from typing import Iterable, List, Optional
-
-from antlr4 import CommonTokenStream, InputStream, ParseTreeWalker
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from antlr4 import (
+    DFA,
+    CommonTokenStream,
+    InputStream,
+    ParserRuleContext,
+    PredictionMode,
+    TerminalNode,
+    Token,
+)
 
 from .expression import (
     NUMBER_PATTERN,
@@ -21,14 +29,26 @@ from .expression import (
 from .grammar.HassILGrammarLexer import HassILGrammarLexer
 from .grammar.HassILGrammarListener import HassILGrammarListener
 from .grammar.HassILGrammarParser import HassILGrammarParser
+from .util import split_lines
+
+_NUMBER_MATCH = NUMBER_PATTERN.match
+_NUMBER_RANGE_MATCH = NUMBER_RANGE_PATTERN.match
 
-GROUP_MARKER = None
+_EMPTY_WORD = Word.empty()
+
+# Contexts whose children are not walked
+_LEAF_CONTEXTS = (
+    HassILGrammarParser.WordContext,
+    HassILGrammarParser.ListContext,
+    HassILGrammarParser.RuleContext,
+    HassILGrammarParser.AltContext,
+)
 
 
 class HassILExpressionListener(HassILGrammarListener):
     """Listener that transforms ANTLR form into expressions."""
 
-    def __init__(self):
+    def __init__(self) -> None:
         # List of sentences parsed so far
         self.sentences: List[Sentence] = []
 
@@ -37,13 +57,39 @@ class HassILExpressionListener(HassILGrammarListener):
 
         # Current sequences being parsed.
         # The last sequence is the current target.
-        # Groups of sequences and sub-sequences are separated with None.
-        self._sequences: List[Optional[Sequence]] = []
+        self._sequences: List[Sequence] = []
+
+        # Index in _sequences of the (group), [optional], or sentence for each
+        # nesting level. The last one is the target of an alternative marker "|".
+        self._group_starts: List[int] = []
+
+        # Enter/exit methods for the contexts this listener handles
+        self._enter_exit: Dict[
+            Type[ParserRuleContext],
+            Tuple[
+                Callable[[ParserRuleContext], None], Callable[[ParserRuleContext], None]
+            ],
+        ] = {
+            HassILGrammarParser.SentenceContext: (
+                self.enterSentence,
+                self.exitSentence,
+            ),
+            HassILGrammarParser.GroupContext: (self.enterGroup, self.exitGroup),
+            HassILGrammarParser.OptionalContext: (
+                self.enterOptional,
+                self.exitOptional,
+            ),
+            HassILGrammarParser.AltContext: (self.enterAlt, self.exitAlt),
+            HassILGrammarParser.RuleContext: (self.enterRule, self.exitRule),
+            HassILGrammarParser.ListContext: (self.enterList, self.exitList),
+            HassILGrammarParser.WordContext: (self.enterWord, self.exitWord),
+        }
 
     def enterSentence(self, ctx: HassILGrammarParser.SentenceContext):
         # Begin new sentence
         self._sentence = Sentence()
         self._sequences = [self._sentence]
+        self._group_starts = [0]
 
     def exitSentence(self, ctx):
         # Complete sentence
@@ -51,11 +97,15 @@ class HassILExpressionListener(HassILGrammarListener):
         self.sentences.append(self._sentence)
         self._sentence = None
         self._sequences = []
+        self._group_starts = []
+
+        # Let the parse tree be freed while later sentences are parsed
+        ctx.parentCtx = None
+        ctx.children = None
 
     def enterGroup(self, ctx):
         # Begin new (group), not a sub-sequence
-        self._sequences.append(GROUP_MARKER)
-        self._sequences.append(Sequence(type=SequenceType.GROUP))
+        self._push_group(Sequence(type=SequenceType.GROUP))
 
     def exitGroup(self, ctx):
         # Complete (group)
@@ -63,11 +113,9 @@ class HassILExpressionListener(HassILGrammarListener):
         self.last_sequence.items.append(group)
 
     def enterOptional(self, ctx):
-        # Begin new [optional], not a sub-sequence
-        self._sequences.append(GROUP_MARKER)
-
+        # Begin new [optional], not a sub-sequence.
         # Start as a group, will convert to alternative at exit
-        self._sequences.append(Sequence(type=SequenceType.GROUP))
+        self._push_group(Sequence(type=SequenceType.GROUP))
 
     def exitOptional(self, ctx):
         # Complete [optional], convert to alternative if necessary
@@ -83,7 +131,7 @@ class HassILExpressionListener(HassILGrammarListener):
             optional.type = SequenceType.ALTERNATIVE
 
         # Optionals are just alternatives with an empty word ("") as an option.
-        optional.items.append(Word.empty())
+        optional.items.append(_EMPTY_WORD)
         self.last_sequence.items.append(optional)
 
     def enterAlt(self, ctx):
@@ -106,86 +154,143 @@ class HassILExpressionListener(HassILGrammarListener):
 
     def enterRule(self, ctx: HassILGrammarParser.RuleContext):
         # <expansion_rule>
-        rule_name = ctx.rule_name().STRING().getText()
+        rule_name = _txt(ctx.rule_name().STRING())
         self.last_sequence.items.append(RuleReference(rule_name))
 
     def enterList(self, ctx):
         # {slot_list}
-        list_name = ctx.list_name().STRING().getText()
+        list_name = _txt(ctx.list_name().STRING())
         self.last_sequence.items.append(ListReference(list_name))
 
     def enterWord(self, ctx: HassILGrammarParser.WordContext):
         # Single word
-        word_text = ctx.STRING().getText().strip()
-        word_text = remove_escapes(word_text)
+        word_text = _txt(ctx.STRING()).strip()
+        if "\\" in word_text:
+            word_text = remove_escapes(word_text)
+
         word_text = remove_quotes(word_text)
 
-        # Check if word is a number
-        match = NUMBER_PATTERN.match(word_text)
-        if match is not None:
-            item: Expression = Number(int(match[1]))
+        # Numbers and ranges must start with a digit or minus sign
+        item: Expression
+        first_char = word_text[:1]
+        if not (first_char.isdigit() or (first_char == "-")):
+            item = Word.get(word_text)
         else:
-            # Check if word is a number range (N..M)
-            match = NUMBER_RANGE_PATTERN.match(word_text)
+            # Check if word is a number
+            match = _NUMBER_MATCH(word_text)
             if match is not None:
-                step_str = match.groupdict().get("step") or "1"
-                item = NumberRange(
-                    lower_bound=int(match[1]),
-                    upper_bound=int(match[2]),
-                    step=int(step_str),
-                )
+                item = Number(int(match[1]))
             else:
-                item = Word(word_text)
+                # Check if word is a number range (N..M)
+                match = _NUMBER_RANGE_MATCH(word_text)
+                if match is not None:
+                    step_str = match.groupdict().get("step") or "1"
+                    item = NumberRange(
+                        lower_bound=int(match[1]),
+                        upper_bound=int(match[2]),
+                        step=int(step_str),
+                    )
+                else:
+                    item = Word.get(word_text)
 
         # Add to last sub-sequence
         self.last_sequence.items.append(item)
 
     def parse_sentences(self, sentences: Iterable[str]):
         """Parse multiple sentences separated by newlines."""
-        text = "\n".join(sentences) + "\n"
-        if text.strip():
-            parser = HassILGrammarParser(
-                CommonTokenStream(HassILGrammarLexer(InputStream(text)))
+        # Drop blank lines and surrounding whitespace before lexing
+        lines = [
+            line.strip(" \t")
+            for text in sentences
+            for line in split_lines(text)
+            if line.strip(" \t")
+        ]
+        if lines:
+            lexer = HassILGrammarLexer(InputStream("\n".join(lines) + "\n"))
+            lexer.removeErrorListeners()
+            token_stream = CommonTokenStream(lexer)
+            parser = HassILGrammarParser(token_stream)
+            parser.removeErrorListeners()
+
+            # Grammar has no SLL conflicts, so skip full-context (LL) prediction
+            parser._interp.predictionMode = (  # pylint: disable=protected-access
+                PredictionMode.SLL
             )
-            walker = ParseTreeWalker()
-            walker.walk(self, parser.document())
+
+            # Parse and walk one sentence at a time instead of the whole document
+            while token_stream.LA(1) != Token.EOF:
+                start_index = token_stream.index
+                self._walk(parser.sentence())
+                if token_stream.index == start_index:
+                    # No progress (syntax error)
+                    break
 
     @property
     def last_sequence(self) -> Sequence:
         """Current sequence or sub-sequence target."""
-        assert self._sequences, "No target sequence"
-        last_sequence = self._sequences[-1]
-        assert last_sequence, "Invalid target sequence"
-        return last_sequence
+        return self._sequences[-1]
 
     @property
     def last_parent_sequence(self) -> Sequence:
         """Current sequence target."""
-        assert self._sequences, "No target sequence"
+        return self._sequences[self._group_starts[-1]]
 
-        # Locate last group marker to determine parent:
-        # [parent, child, child, None, parent, ...]
-        parent_sequence: Optional[Sequence] = None
-        for sequence in reversed(self._sequences):
-            if sequence is GROUP_MARKER:
-                break
+    def _walk(self, ctx: ParserRuleContext):
+        """
+        Walk a parse tree, calling enter/exit methods for handled contexts.
 
-            parent_sequence = sequence
+        Replaces ParseTreeWalker, which calls every listener method for every node.
+        """
+        enter_exit = self._enter_exit.get(type(ctx))
+        if enter_exit is not None:
+            enter_exit[0](ctx)
 
-        assert parent_sequence, "No parent sequence"
-        return parent_sequence
+        if ctx.children and (not isinstance(ctx, _LEAF_CONTEXTS)):
+            for child in ctx.children:
+                if isinstance(child, ParserRuleContext):
+                    self._walk(child)
+
+        if enter_exit is not None:
+            enter_exit[1](ctx)
+
+    def _push_group(self, group: Sequence):
+        """Make a new group the current target and parent."""
+        self._group_starts.append(len(self._sequences))
+        self._sequences.append(group)
 
     def _pop_group(self) -> Sequence:
-        """Remove sequences until a group marker is encountered."""
-        assert len(self._sequences) > 1, "Bad sequence stack"
-        item = self._sequences.pop()
-        while self._sequences[-1] is not GROUP_MARKER:
-            item = self._sequences.pop()
+        """Remove the current group and its sub-sequences."""
+        start = self._group_starts.pop()
+        if start == len(self._sequences) - 1:
+            # No sub-sequences (no alternatives in group)
+            return self._sequences.pop()
+
+        group = self._sequences[start]
+        del self._sequences[start:]
+
+        return group
+
+
+def clear_antlr_caches():
+    """
+    Free the prediction caches shared by all ANTLR lexers/parsers.
+
+    ANTLR keeps these for the life of the process. Must not be called while
+    another thread is parsing.
+    """
+    _clear_dfa(HassILGrammarLexer)
+    _clear_dfa(HassILGrammarParser)
+    HassILGrammarParser.sharedContextCache.cache.clear()
+
 
-        assert item is not None, "Invalid last sequence"
+def _clear_dfa(recognizer_class):
+    """Reset the DFA cache shared by all instances of a generated lexer/parser."""
+    recognizer_class.decisionsToDFA[:] = [
+        DFA(decision_state, decision)
+        for decision, decision_state in enumerate(recognizer_class.atn.decisionToState)
+    ]
 
-        # Remove group marker
-        marker = self._sequences.pop()
-        assert marker is GROUP_MARKER, "Missing group marker"
 
-        return item
+def _txt(terminal_node: TerminalNode) -> str:
+    """Text of a terminal node's token (skips getText())."""
+    return terminal_node.symbol.text
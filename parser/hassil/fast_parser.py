@@ -0,0 +1,222 @@
+"""Recursive-descent parser for sentence templates (no ANTLR)."""
+import re
+from typing import Iterable, List, Tuple
+
+from .expression import (
+    NUMBER_PATTERN,
+    NUMBER_RANGE_PATTERN,
+    Expression,
+    ListReference,
+    Number,
+    NumberRange,
+    RuleReference,
+    Sentence,
+    Sequence,
+    SequenceType,
+    Word,
+    remove_escapes,
+    remove_quotes,
+)
+from .util import split_lines
+
+# Unquoted STRING in HassILGrammar.g4
+_UNQUOTED = r'(?:\\["<>()\[\]{}]|[^ \t\n\r"<>()\[\]{}])+'
+
+# Mirrors the lexer rules in HassILGrammar.g4 (WS is only spaces and tabs).
+# A lone "|" is lexed as a word and treated as an alternative marker.
+_TOKEN_RE = re.compile(
+    r"(?P<ws>[ \t]+)"
+    r"|(?P<open>[(\[])"
+    r"|(?P<close>[)\]])"
+    rf"|\{{(?P<list>{_UNQUOTED})\}}"
+    rf"|<(?P<rule>{_UNQUOTED})>"
+    rf'|(?P<word>"(?:\\"|[^"])*"|{_UNQUOTED})'
+    r"|(?P<error>[\s\S])"
+)
+
+_NUMBER_MATCH = NUMBER_PATTERN.match
+_NUMBER_RANGE_MATCH = NUMBER_RANGE_PATTERN.match
+
+_EMPTY_WORD = Word.empty()
+
+_ALT = "|"
+_CLOSERS = {"(": ")", "[": "]"}
+
+Token = Tuple[str, str]
+
+
+def parse_sentences(texts: Iterable[str]) -> List[Sentence]:
+    """Parse multiple sentences separated by newlines."""
+    sentences: List[Sentence] = []
+    for line in split_lines("\n".join(texts)):
+        if line.strip(" \t"):
+            sentences.append(parse_sentence(line))
+
+    return sentences
+
+
+def parse_sentence(text: str) -> Sentence:
+    """
+    Parse a single sentence template.
+
+    Raises ValueError for templates that don't match the grammar.
+    """
+    tokens = _tokenize(text.strip(" \t"))
+    sentence = Sentence()
+    pos = _parse_alt(tokens, 0, sentence)
+    if pos < len(tokens):
+        raise ValueError(f"Unexpected '{tokens[pos][1]}' in template: {text}")
+
+    return sentence
+
+
+def _tokenize(text: str) -> List[Token]:
+    """Split template text into (kind, text) tokens."""
+    tokens: List[Token] = []
+    for match in _TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        assert kind is not None
+        if kind == "error":
+            raise ValueError(f"Unexpected '{match[0]}' in template: {text}")
+
+        token_text = match[kind]
+        if (kind == "word") and (token_text == _ALT):
+            kind = _ALT
+
+        tokens.append((kind, token_text))
+
+    return tokens
+
+
+def _kind(tokens: List[Token], pos: int) -> str:
+    """Kind of token at pos, or "" past the end."""
+    return tokens[pos][0] if pos < len(tokens) else ""
+
+
+def _parse_alt(tokens: List[Token], pos: int, sequence: Sequence) -> int:
+    """Parse items into sequence, converting it to an alternative on "|"."""
+    target = sequence
+    while True:
+        pos = _parse_seq(tokens, pos, target.items)
+
+        # alt: WS? '|' WS?
+        alt_pos = (pos + 1) if (_kind(tokens, pos) == "ws") else pos
+        if _kind(tokens, alt_pos) != _ALT:
+            return pos
+
+        pos = alt_pos + 1
+        if _kind(tokens, pos) == "ws":
+            pos += 1
+
+        if sequence.type != SequenceType.ALTERNATIVE:
+            # Convert to alternative
+            if sequence.items:
+                # Wrap into a group
+                sequence.items = [
+                    Sequence(type=SequenceType.GROUP, items=sequence.items)
+                ]
+
+            sequence.type = SequenceType.ALTERNATIVE
+
+        # Start new group (sub-sequence)
+        target = Sequence(type=SequenceType.GROUP)
+        sequence.items.append(target)
+
+
+def _parse_seq(tokens: List[Token], pos: int, items: List[Expression]) -> int:
+    """Parse whitespace-separated items until "|", a closing bracket, or the end."""
+    while True:
+        pos = _parse_item(tokens, pos, items)
+        kind = _kind(tokens, pos)
+        if kind == "ws":
+            if _kind(tokens, pos + 1) == _ALT:
+                return pos
+
+            # Another item must follow
+            pos += 1
+        elif kind in ("", _ALT, "close"):
+            return pos
+        else:
+            # Items must be separated by whitespace or "|"
+            raise ValueError(f"Missing whitespace before '{tokens[pos][1]}'")
+
+
+def _parse_item(tokens: List[Token], pos: int, items: List[Expression]) -> int:
+    """Parse a single word, list, rule, group, or optional."""
+    kind = _kind(tokens, pos)
+    if kind == "word":
+        items.append(_make_word_item(tokens[pos][1]))
+    elif kind == "list":
+        items.append(ListReference(tokens[pos][1]))
+    elif kind == "rule":
+        items.append(RuleReference(tokens[pos][1]))
+    elif kind == "open":
+        group, pos = _parse_group(tokens, pos)
+        items.append(group)
+        return pos
+    elif kind:
+        raise ValueError(f"Unexpected '{tokens[pos][1]}'")
+    else:
+        raise ValueError("Unexpected end of template")
+
+    return pos + 1
+
+
+def _parse_group(tokens: List[Token], pos: int) -> Tuple[Sequence, int]:
+    """Parse a (group) or [optional] starting at its opening bracket."""
+    opener = tokens[pos][1]
+    group = Sequence(type=SequenceType.GROUP)
+    pos = _parse_alt(tokens, pos + 1, group)
+
+    if (pos >= len(tokens)) or (tokens[pos][1] != _CLOSERS[opener]):
+        raise ValueError(f"Missing '{_CLOSERS[opener]}' for '{opener}'")
+
+    if opener == "[":
+        _make_optional(group)
+
+    return group, pos + 1
+
+
+def _make_optional(group: Sequence):
+    """Convert a completed [optional] group to an alternative in place."""
+    if group.type != SequenceType.ALTERNATIVE:
+        if len(group.items) > 1:
+            # Wrap in group
+            group.items = [Sequence(type=SequenceType.GROUP, items=group.items)]
+
+        # A single item needs no wrapper group
+        group.type = SequenceType.ALTERNATIVE
+
+    # Optionals are just alternatives with an empty word ("") as an option.
+    group.items.append(_EMPTY_WORD)
+
+
+def _make_word_item(word_text: str) -> Expression:
+    """Create a word, number, or number range from word text."""
+    word_text = word_text.strip()
+    if "\\" in word_text:
+        word_text = remove_escapes(word_text)
+
+    word_text = remove_quotes(word_text)
+
+    # Numbers and ranges must start with a digit or minus sign
+    first_char = word_text[:1]
+    if not (first_char.isdigit() or (first_char == "-")):
+        return Word.get(word_text)
+
+    # Check if word is a number
+    match = _NUMBER_MATCH(word_text)
+    if match is not None:
+        return Number(int(match[1]))
+
+    # Check if word is a number range (N..M)
+    match = _NUMBER_RANGE_MATCH(word_text)
+    if match is not None:
+        step_str = match.groupdict().get("step") or "1"
+        return NumberRange(
+            lower_bound=int(match[1]),
+            upper_bound=int(match[2]),
+            step=int(step_str),
+        )
+
+    return Word.get(word_text)
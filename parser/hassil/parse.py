@@ -1,26 +1,146 @@
 """Convenience methods for parsing sentences."""
 
-from typing import Iterable, List
+import dataclasses
+import threading
+import weakref
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Tuple
 
-from .expression import Sentence
-from .expression_listener import HassILExpressionListener
+from . import fast_parser
+from .expression import (
+    Expression,
+    ListReference,
+    Number,
+    NumberRange,
+    RuleReference,
+    Sentence,
+    Sequence,
+    Word,
+)
+from .expression_listener import HassILExpressionListener, clear_antlr_caches
+from .util import split_lines
 
+# Held while the ANTLR parser runs, since its caches are shared class state
+_ANTLR_LOCK = threading.Lock()
+
+# Set when the ANTLR caches have something to clear
+_ANTLR_USED = threading.Event()
+
+# Sub-expressions shared between sentences, keyed by structure.
+# Dropped when no cached or user-held sentence uses them anymore.
+_SHARED_EXPRESSIONS: "weakref.WeakValueDictionary[Tuple[Any, ...], Expression]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def parse_sentences(
+    texts: Iterable[str], keep_text: bool = False, use_fast_parser: bool = True
+) -> List[Sentence]:
+    """
+    Parses a list of sentences into expressions.
+
+    The ANTLR parser is used instead when use_fast_parser is False.
+    """
+    sentences: List[Sentence] = []
+    for text in texts:
+        for line in split_lines(text):
+            if line.strip(" \t"):
+                sentence = _parse_one_sentence(line, use_fast_parser)
+
+                # Sub-expressions are shared with the cached sentence
+                sentences.append(
+                    dataclasses.replace(sentence, items=list(sentence.items))
+                )
+
+    if _ANTLR_USED.is_set():
+        # Once per call instead of once per line
+        with _ANTLR_LOCK:
+            _ANTLR_USED.clear()
+            clear_antlr_caches()
 
-def parse_sentences(texts: Iterable[str], keep_text: bool = False) -> List[Sentence]:
-    """Parses a list of sentences into expressions."""
-    listener = HassILExpressionListener()
-    listener.parse_sentences(texts)
     if keep_text:
-        for text, sentence in zip(texts, listener.sentences):
+        for text, sentence in zip(texts, sentences):
             sentence.text = text
 
-    return listener.sentences
+    return sentences
 
 
-def parse_sentence(text: str, keep_text: bool = False) -> Sentence:
+def parse_sentence(
+    text: str, keep_text: bool = False, use_fast_parser: bool = True
+) -> Sentence:
     """Parses a single sentence."""
-    sentence = parse_sentences([text])[0]
+    sentence = parse_sentences([text], use_fast_parser=use_fast_parser)[0]
     if keep_text:
         sentence.text = text
 
     return sentence
+
+
+def parser_cache_stats():
+    """Hit/miss statistics for the cache of parsed sentences."""
+    return _parse_one_sentence.cache_info()  # pylint: disable=no-value-for-parameter
+
+
+@lru_cache(maxsize=4096)
+def _parse_one_sentence(text: str, use_fast_parser: bool) -> Sentence:
+    """Parses a single line of text into a sentence (cached)."""
+    sentence: Optional[Sentence] = None
+    if use_fast_parser:
+        try:
+            sentence = fast_parser.parse_sentence(text)
+        except ValueError:
+            # Malformed template (e.g., stray bracket in an entity name).
+            # Fall back to the ANTLR parser, which recovers from errors.
+            pass
+
+    if sentence is None:
+        listener = HassILExpressionListener()
+        with _ANTLR_LOCK:
+            _ANTLR_USED.set()
+            listener.parse_sentences([text])
+        if not listener.sentences:
+            raise ValueError(f"No sentence parsed: {text}")
+
+        sentence = listener.sentences[0]
+
+    sentence.items = [_share_expression(item)[0] for item in sentence.items]
+
+    return sentence
+
+
+def _share_expression(expression: Expression) -> Tuple[Expression, Tuple[Any, ...]]:
+    """
+    Return a shared expression with the same structure, and its structural key.
+
+    Shared expressions are used by many sentences and must not be modified.
+    """
+    key: Tuple[Any, ...]
+    if isinstance(expression, Sequence):
+        shared_items: List[Expression] = []
+        item_keys: List[Tuple[Any, ...]] = []
+        for item in expression.items:
+            shared_item, item_key = _share_expression(item)
+            shared_items.append(shared_item)
+            item_keys.append(item_key)
+
+        expression.items = shared_items
+        key = (type(expression), expression.type, tuple(item_keys))
+    elif isinstance(expression, Word):
+        key = (Word, expression.text)
+    elif isinstance(expression, ListReference):
+        key = (ListReference, expression.list_name, expression.slot_name)
+    elif isinstance(expression, RuleReference):
+        key = (RuleReference, expression.rule_name)
+    elif isinstance(expression, Number):
+        key = (Number, expression.number)
+    elif isinstance(expression, NumberRange):
+        key = (
+            NumberRange,
+            expression.lower_bound,
+            expression.upper_bound,
+            expression.step,
+        )
+    else:
+        raise ValueError(f"Unexpected expression: {expression}")
+
+    return _SHARED_EXPRESSIONS.setdefault(key, expression), key
@@ -3,7 +3,7 @@
 import dataclasses
 import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Optional, Set, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from .expression import (
     Expression,
@@ -16,7 +16,7 @@ from .expression import (
     SequenceType,
     Word,
 )
-from .intents import Intent, Intents, RangeSlotList, SlotList, TextSlotList
+from .intents import Intent, IntentData, Intents, RangeSlotList, SlotList, TextSlotList
 
 NUMBER_START = re.compile(r"^(-?[0-9]+).*$")
 
@@ -116,12 +116,88 @@ def recognize(
     skip_words: Optional[Set[str]] = None,
 ) -> Optional[RecognizeResult]:
     """Return the first match of input text/words against a collection of intents."""
+    slot_lists, expansion_rules, skip_words = _combine_with_intents(
+        intents, slot_lists, expansion_rules, skip_words
+    )
+
+    return _recognize_first(
+        _get_words(text_or_words),
+        (
+            (intent, intent_data, intent_sentence)
+            for intent in intents.intents.values()
+            for intent_data in intent.data
+            for intent_sentence in intent_data.sentences
+        ),
+        slot_lists,
+        expansion_rules,
+        skip_words,
+    )
+
+
+class PreparedRecognizer:
+    """
+    Recognizes many sentences against the same intents.
+
+    Slot lists, expansion rules, and skip words are combined once, and
+    templates whose required words are missing from the input are skipped.
+    """
+
+    def __init__(
+        self,
+        intents: Intents,
+        slot_lists: Optional[Dict[str, SlotList]] = None,
+        expansion_rules: Optional[Dict[str, Sentence]] = None,
+        skip_words: Optional[Set[str]] = None,
+    ):
+        self.intents = intents
+        self.slot_lists, self.expansion_rules, self.skip_words = _combine_with_intents(
+            intents, slot_lists, expansion_rules, skip_words
+        )
+
+        # (intent, data, sentence, pre-processed words that must be in the input)
+        self._templates: List[Tuple[Intent, IntentData, Sentence, Set[str]]] = [
+            (intent, intent_data, intent_sentence, _required_words(intent_sentence))
+            for intent in intents.intents.values()
+            for intent_data in intent.data
+            for intent_sentence in intent_data.sentences
+        ]
+
+    def recognize(
+        self, text_or_words: Union[str, List[str]]
+    ) -> Optional[RecognizeResult]:
+        """Return the first match of input text/words against the intents."""
+        words = _get_words(text_or_words)
+        input_words = {_preprocess_word(word) for word in words}
+
+        return _recognize_first(
+            words,
+            (
+                (intent, intent_data, intent_sentence)
+                for intent, intent_data, intent_sentence, required_words in self._templates
+                if required_words.issubset(input_words)
+            ),
+            self.slot_lists,
+            self.expansion_rules,
+            self.skip_words,
+        )
+
+
+def _get_words(text_or_words: Union[str, List[str]]) -> List[str]:
+    """Split input text into words if necessary."""
     if isinstance(text_or_words, str):
         # TODO: tokenize for language
-        words = _tokenize_sentence(_preprocess_sentence(text_or_words))
-    else:
-        words = text_or_words
+        return _tokenize_sentence(_preprocess_sentence(text_or_words))
 
+    return text_or_words
+
+
+def _combine_with_intents(
+    intents: Intents,
+    slot_lists: Optional[Dict[str, SlotList]],
+    expansion_rules: Optional[Dict[str, Sentence]],
+    skip_words: Optional[Set[str]],
+) -> Tuple[Dict[str, SlotList], Dict[str, Sentence], Set[str]]:
+    """Combine slot lists, expansion rules, and skip words with those in intents."""
     if slot_lists is None:
         slot_lists = intents.slot_lists
     else:
@@ -146,40 +222,69 @@ def recognize(
     # Preprocess skip words
     skip_words = {_preprocess_word(word) for word in skip_words}
 
+    return slot_lists, expansion_rules, skip_words
+
+
+def _recognize_first(
+    words: List[str],
+    templates: Iterable[Tuple[Intent, IntentData, Sentence]],
+    slot_lists: Dict[str, SlotList],
+    expansion_rules: Dict[str, Sentence],
+    skip_words: Set[str],
+) -> Optional[RecognizeResult]:
+    """Return the first template match for input words."""
     # Check sentence against each intent.
     # This should eventually be done in parallel.
-    for intent in intents.intents.values():
-        for intent_data in intent.data:
-            for intent_sentence in intent_data.sentences:
-                # Create initial context
-                context = MatchContext(
-                    words=words,
-                    slot_lists=slot_lists,
-                    expansion_rules=expansion_rules,
-                    skip_words=skip_words,
-                )
-                sentence_contexts = _match_and_skip(context, intent_sentence)
-                for sentence_context in sentence_contexts:
-                    if sentence_context.is_match:
-                        # Add fixed entities
-                        for slot_name, slot_value in intent_data.slots.items():
-                            sentence_context.entities.append(
-                                MatchEntity(name=slot_name, value=slot_value)
-                            )
+    for intent, intent_data, intent_sentence in templates:
+        # Create initial context
+        context = MatchContext(
+            words=words,
+            slot_lists=slot_lists,
+            expansion_rules=expansion_rules,
+            skip_words=skip_words,
+        )
+        sentence_contexts = _match_and_skip(context, intent_sentence)
+        for sentence_context in sentence_contexts:
+            if sentence_context.is_match:
+                # Add fixed entities
+                for slot_name, slot_value in intent_data.slots.items():
+                    sentence_context.entities.append(
+                        MatchEntity(name=slot_name, value=slot_value)
+                    )
 
-                        # Return the first match
-                        return RecognizeResult(
-                            intent,
-                            {
-                                entity.name: entity
-                                for entity in sentence_context.entities
-                            },
-                            sentence_context.entities,
-                        )
+                # Return the first match
+                return RecognizeResult(
+                    intent,
+                    {entity.name: entity for entity in sentence_context.entities},
+                    sentence_context.entities,
+                )
 
     return None
 
 
+def _required_words(expression: Expression) -> Set[str]:
+    """Pre-processed template words that every match must consume from the input."""
+    if isinstance(expression, Word):
+        if expression.is_empty:
+            return set()
+
+        return {_preprocess_word(expression.text)}
+
+    if isinstance(expression, Sequence):
+        item_words = [_required_words(item) for item in expression.items]
+        if not item_words:
+            return set()
+
+        if expression.type == SequenceType.ALTERNATIVE:
+            # Only words required by every alternative
+            return set.intersection(*item_words)
+
+        return set.union(*item_words)
+
+    # Lists, rules, and numbers are not checked
+    return set()
+
+
 def is_match(
     text_or_words: Union[str, List[str]],
     sentence: Sentence,
@@ -1,26 +1,32 @@
 """Utility methods"""
-import collections
+import collections.abc
+import re
+from typing import List
+
+# End of line in sentence templates (EOL in HassILGrammar.g4)
+LINE_SEPARATOR = re.compile(r"\r?\n|\r")
 
 
 def merge_dict(base_dict, new_dict):
     """Merges new_dict into base_dict."""
     for key, value in new_dict.items():
-        if key in base_dict:
-            old_value = base_dict[key]
-            if isinstance(old_value, collections.abc.MutableMapping):
-                # Combine dictionary
-                assert isinstance(
-                    value, collections.abc.Mapping
-                ), f"Not a dict: {value}"
-                merge_dict(old_value, value)
-            elif isinstance(old_value, collections.abc.MutableSequence):
-                # Combine list
-                assert isinstance(
-                    value, collections.abc.Sequence
-                ), f"Not a list: {value}"
-                old_value.extend(value)
-            else:
-                # Overwrite
-                base_dict[key] = value
+        old_value = base_dict.get(key)
+        if old_value is None:
+            # New key
+            base_dict[key] = value
+        elif isinstance(old_value, collections.abc.MutableMapping):
+            # Combine dictionary
+            assert isinstance(value, collections.abc.Mapping), f"Not a dict: {value}"
+            merge_dict(old_value, value)
+        elif isinstance(old_value, collections.abc.MutableSequence):
+            # Combine list
+            assert isinstance(value, collections.abc.Sequence), f"Not a list: {value}"
+            old_value.extend(value)
         else:
+            # Overwrite
             base_dict[key] = value
+
+
+def split_lines(text: str) -> List[str]:
+    """Split text into lines on \\n, \\r\\n, or \\r only (unlike str.splitlines)."""
+    return LINE_SEPARATOR.split(text)
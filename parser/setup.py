@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import os
 from pathlib import Path
 
 import setuptools
@@ -25,6 +26,15 @@ version_path = module_dir / "VERSION"
 with open(version_path, "r", encoding="utf-8") as version_file:
     version = version_file.read().strip()
 
+# Optionally compile the template parser to a C extension with mypyc.
+# Only fast_parser is compiled: the ANTLR listener subclasses interpreted
+# classes, and the expression dataclasses are rebuilt at import time.
+ext_modules = []
+if os.environ.get("HASSIL_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify([str(module_dir / "fast_parser.py")])
+
 # -----------------------------------------------------------------------------
 
 setup(
@@ -41,6 +51,7 @@ setup(
         "hassil": ["VERSION", "py.typed"],
     },
     install_requires=requirements,
+    ext_modules=ext_modules,
     extras_require={':python_version<"3.9"': ["importlib_resources"]},
     entry_points={
         "console_scripts": [
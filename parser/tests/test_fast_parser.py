@@ -0,0 +1,70 @@
+"""Tests for the recursive-descent parser"""
+import pytest
+
+from hassil import fast_parser, parse_sentences
+from hassil.expression import Word
+
+TEMPLATES = [
+    "this is a test",
+    "(this is a test)",
+    "this [is [a]] test",
+    "this is (a bigger | the biggest) test",
+    "(what | what's | whats | what is)",
+    "[the] {name} [in|from] [the] <area>",
+    "turn on a|b",
+    "(|a) (a|) [a|b c]",
+    "top | level",
+    'this is a "\\"test\\""',
+    "this \\[is\\] a \\{test\\}",
+    "set {brightness:brightness_pct} to 1..100,2 percent at 5",
+    "a\xa0b\x0cc",
+]
+
+
+@pytest.mark.parametrize("template", TEMPLATES)
+def test_same_as_antlr(template):
+    assert parse_sentences([template]) == parse_sentences(
+        [template], use_fast_parser=False
+    )
+
+
+def test_multiple_lines():
+    assert len(parse_sentences(["a b\nc d", "", "e"])) == 3
+    assert len(parse_sentences(["a\r\nb\rc\n \t\n"])) == 3
+
+
+def test_grammar_whitespace():
+    # Only spaces/tabs separate words and only \n/\r separate lines
+    sentences = parse_sentences(["a\xa0b\x0cc d\u2028e"], keep_text=True)
+    assert len(sentences) == 1
+    assert sentences[0].text == "a\xa0b\x0cc d\u2028e"
+    assert sentences[0].items == [Word("a\xa0b\x0cc"), Word("d\u2028e")]
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "(a b",
+        "a b]",
+        "[a b)",
+        'a "b',
+        "Lamp(1)",
+        "a{b}c",
+        "(a)b",
+        "| a",
+        "((a|b)|c)",
+        "(|)",
+        "[|]",
+        "(a )",
+        "a |",
+        "{a b}",
+    ],
+)
+def test_malformed(template):
+    with pytest.raises(ValueError):
+        fast_parser.parse_sentence(template)
+
+    # Falls back to ANTLR, which recovers from errors
+    assert parse_sentences([template]) == parse_sentences(
+        [template], use_fast_parser=False
+    )
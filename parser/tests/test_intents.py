@@ -47,6 +47,12 @@ def test_list():
     assert is_match("turn off living room", sentence, slot_lists={"area": areas})
 
 
+def test_list_stray_brackets():
+    sentence = parse_sentence("turn on {name}")
+    names = TextSlotList.from_strings(["Happy lamp :)", 'TV 65"', "Desk [old"])
+    assert is_match("turn on desk old", sentence, slot_lists={"name": names})
+
+
 def test_rule():
     sentence = parse_sentence("turn off <area>")
     assert is_match(
@@ -0,0 +1,70 @@
+"""Tests for parse_sentences convenience methods"""
+import gc
+import weakref
+
+import pytest
+
+from hassil import parse_sentence, parse_sentences
+from hassil.expression import Word
+from hassil.grammar.HassILGrammarParser import HassILGrammarParser
+from hassil.parse import _SHARED_EXPRESSIONS, _parse_one_sentence, parser_cache_stats
+
+
+def test_cached_sentence_is_copied():
+    sentence1 = parse_sentence("turn on the light", keep_text=True)
+    sentence2 = parse_sentence("turn on the light")
+    assert sentence1.text == "turn on the light"
+    assert sentence2.text is None
+
+    sentence2.items.clear()
+    assert parse_sentence("turn on the light").items
+
+
+def test_parser_cache_stats():
+    hits = parser_cache_stats().hits
+    parse_sentence("set the temperature to 20")
+    parse_sentence("set the temperature to 20")
+    assert parser_cache_stats().hits > hits
+
+
+def test_sub_expressions_are_shared():
+    sentence1 = parse_sentence("turn on [the] {name} [in|from] <area>")
+    sentence2 = parse_sentence("switch off [the] {name} [in|from] <area>")
+    assert sentence1.items[2:] == sentence2.items[2:]
+    assert all(
+        item1 is item2 for item1, item2 in zip(sentence1.items[2:], sentence2.items[2:])
+    )
+    assert sentence1.items[0] != sentence2.items[0]
+
+
+def test_shared_expressions_are_freed():
+    num_shared = len(_SHARED_EXPRESSIONS)
+    sentences = parse_sentences([f"shared pool test {i}x" for i in range(100)])
+    assert len(_SHARED_EXPRESSIONS) >= num_shared + 100
+
+    # Not held by the parse cache or any sentence
+    del sentences
+    _parse_one_sentence.cache_clear()
+    gc.collect()
+    assert len(_SHARED_EXPRESSIONS) <= num_shared
+
+
+def test_no_sentence():
+    with pytest.raises(ValueError):
+        parse_sentence('"')
+
+
+def test_antlr_caches_cleared():
+    parse_sentences(["antlr (cache | test) 1", "[antlr] cache"], use_fast_parser=False)
+    assert not HassILGrammarParser.sharedContextCache.cache
+
+
+def test_word_pool_is_weak():
+    word = Word.get("unused pooled word")
+    assert Word.get("unused pooled word") is word
+
+    # Not kept alive by the pool
+    ref = weakref.ref(word)
+    del word
+    gc.collect()
+    assert ref() is None
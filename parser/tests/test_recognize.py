@@ -2,7 +2,7 @@ import io
 
 import pytest
 
-from hassil import Intents, recognize
+from hassil import Intents, PreparedRecognizer, recognize
 from hassil.intents import TextSlotList
 
 TEST_YAML = """
@@ -106,3 +106,17 @@ def test_temperature(intents, slot_lists):
 
     # From YAML
     assert result.entities["domain"].value == "climate"
+
+
+# pylint: disable=redefined-outer-name
+def test_prepared_recognizer(intents, slot_lists):
+    recognizer = PreparedRecognizer(intents, slot_lists=slot_lists)
+    for sentence in [
+        "turn on kitchen TV, please",
+        "set the brightness in the living room to 75%",
+        "what is the temperature in the living room?",
+        "turn off the kitchen TV",
+    ]:
+        assert recognizer.recognize(sentence) == recognize(
+            sentence, intents, slot_lists=slot_lists
+        )
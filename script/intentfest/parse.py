@@ -4,16 +4,27 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import yaml
 from hassil.intents import Intents, SlotList, TextSlotList
-from hassil.recognize import recognize
+from hassil.recognize import PreparedRecognizer, RecognizeResult
 from hassil.util import merge_dict
 
 from .const import LANGUAGES, SENTENCE_DIR, TESTS_DIR
 from .util import get_base_arg_parser
 
+try:
+    # Use libyaml if available
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 def get_arguments() -> argparse.Namespace:
     """Get parsed passed in arguments."""
@@ -42,7 +53,7 @@ def run() -> int:
     tests_dir = TESTS_DIR / args.language
 
     # Load test areas and entities for language
-    test_names = yaml.safe_load((tests_dir / "_common.yaml").read_text())
+    test_names = _load_yaml((tests_dir / "_common.yaml").read_bytes())
 
     slot_lists: Dict[str, SlotList] = {
         "area": TextSlotList.from_tuples(
@@ -56,15 +67,23 @@ def run() -> int:
     # Load intents
     intents_dict: Dict[str, Any] = {}
     for intent_path in language_dir.glob("*.yaml"):
-        with open(intent_path, "r", encoding="utf-8") as intent_file:
-            merge_dict(intents_dict, yaml.safe_load(intent_file))
+        merge_dict(intents_dict, _load_yaml(intent_path.read_bytes()))
 
     assert intents_dict, "No intent YAML files loaded"
     intents = Intents.from_dict(intents_dict)
 
     # Parse sentences
+    recognizer = PreparedRecognizer(intents, slot_lists=slot_lists)
+    results: Dict[str, Optional[RecognizeResult]] = {}
+    output = sys.stdout.buffer
     for sentence in args.sentence:
-        result = recognize(sentence, intents, slot_lists=slot_lists)
+        if sentence in results:
+            # Repeated sentence
+            result = results[sentence]
+        else:
+            result = recognizer.recognize(sentence)
+            results[sentence] = result
+
         output_dict = {"text": sentence, "match": result is not None}
         if result is not None:
             output_dict["intent"] = result.intent.name
@@ -72,7 +91,23 @@ def run() -> int:
                 entity.name: entity.value for entity in result.entities_list
             }
 
-        json.dump(output_dict, sys.stdout, ensure_ascii=False, indent=2)
-        print("")
+        output.write(_dump_json(output_dict))
+        output.write(b"\n")
+
+    output.flush()
 
     return 0
+
+
+def _dump_json(obj: Any) -> bytes:
+    """Encode indented JSON as UTF-8, using orjson if available."""
+    if orjson is not None:
+        # pylint: disable=no-member
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _load_yaml(yaml_bytes: bytes) -> Any:
+    """Decode a YAML document, using libyaml if available."""
+    return yaml.load(yaml_bytes, Loader=_Loader)
@@ -0,0 +1,26 @@
+"""Test language sentences with both template parsers."""
+from typing import List
+
+import yaml
+from hassil import parse_sentences
+
+from . import USER_SENTENCES_DIR
+
+
+def test_language_parser(language: str):
+    """Ensure the fast parser gives the same sentences as the ANTLR parser"""
+    templates: List[str] = []
+    for yaml_path in (USER_SENTENCES_DIR / language).glob("*.yaml"):
+        with open(yaml_path, "r", encoding="utf-8") as yaml_file:
+            yaml_dict = yaml.safe_load(yaml_file)
+
+        for intent_dict in yaml_dict.get("intents", {}).values():
+            for data_dict in intent_dict["data"]:
+                templates.extend(data_dict["sentences"])
+
+        templates.extend(yaml_dict.get("expansion_rules", {}).values())
+
+    assert templates, f"No sentence templates loaded for {language}"
+    assert parse_sentences(templates) == parse_sentences(
+        templates, use_fast_parser=False
+    )